@@ -0,0 +1,156 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+"""
+Ahead-of-time compiled version of the kernels in `dp_forest_numba.py`.
+
+Numba compiles on first use, which costs seconds per fresh process; for short
+scripts that is more than the DP itself. I'm providing the same three kernels
+as a Cython extension so they are machine code from the start. Build in place
+with:
+
+    cythonize -i _dp_kernel.pyx
+
+`dp_forest_numba` picks this module up when Numba is not installed and falls
+back to the uncompiled kernels when the extension has not been built.
+
+All arrays are C-contiguous int32 (uint8 for `cams`) and are filled in place.
+"""
+from libc.stdlib cimport malloc, free
+
+
+cpdef void order_kernel(int[::1] indptr, int[::1] indices, int[::1] order, int[::1] parent):
+    """
+    Iterative pre-order of every tree in the forest, trees one after another,
+    each rooted at its smallest node. parent must be filled with -1 on entry.
+    """
+    cdef int n = indptr.shape[0] - 1
+    cdef int root, v, c, i, top
+    cdef int count = 0
+    cdef int* stack = <int*>malloc((n + 1) * sizeof(int))
+    cdef unsigned char* visited = <unsigned char*>malloc(n + 1)
+    if stack == NULL or visited == NULL:
+        free(stack)
+        free(visited)
+        raise MemoryError()
+    try:
+        for v in range(n):
+            visited[v] = 0
+        for root in range(n):
+            if visited[root]:
+                continue
+            top = 1
+            stack[0] = root
+            visited[root] = 1
+            while top > 0:
+                top -= 1
+                v = stack[top]
+                order[count] = v
+                count += 1
+                for i in range(indptr[v], indptr[v + 1]):
+                    c = indices[i]
+                    if not visited[c]:
+                        visited[c] = 1
+                        parent[c] = v
+                        stack[top] = c
+                        top += 1
+    finally:
+        free(stack)
+        free(visited)
+
+
+cpdef int dp_kernel(
+    int[::1] indptr,
+    int[::1] indices,
+    int[::1] order,
+    int[::1] parent,
+    int[::1] dp0,
+    int[::1] dp1,
+    int[::1] dp2,
+    int[::1] best_child,
+    int INF,
+):
+    """
+    Bottom-up 3-state DP (see `dp_forest.min_cameras_for_tree` for the states).
+    Fills dp0/dp1/dp2/best_child for the trees in `order` (any run of whole
+    trees) and returns their minimum camera count.
+    """
+    cdef int n = order.shape[0]
+    cdef int k, i, v, c, c0, c1, c2, m01, g
+    cdef int a0, a2, base, gain, best
+    cdef int total = 0
+    for k in range(n - 1, -1, -1):
+        v = order[k]
+        a0 = 1
+        a2 = 0
+        base = 0
+        gain = INF
+        best = -1
+        for i in range(indptr[v], indptr[v + 1]):
+            c = indices[i]
+            if parent[c] != v:
+                continue
+            c0 = dp0[c]
+            c1 = dp1[c]
+            c2 = dp2[c]
+            m01 = c0 if c0 < c1 else c1
+            a0 += m01 if m01 < c2 else c2
+            a2 += m01
+            base += m01
+            g = c0 - m01
+            if g < gain:
+                gain = g
+                best = c
+        dp0[v] = a0
+        dp2[v] = a2
+        dp1[v] = base + gain if best >= 0 else INF
+        best_child[v] = best
+        if parent[v] == -1:
+            # Root must be monitored, so only states 0 and 1 count
+            total += dp0[v] if dp0[v] < dp1[v] else dp1[v]
+    return total
+
+
+cpdef void recon_kernel(
+    int[::1] indptr,
+    int[::1] indices,
+    int[::1] order,
+    int[::1] parent,
+    int[::1] dp0,
+    int[::1] dp1,
+    int[::1] dp2,
+    int[::1] best_child,
+    unsigned char[::1] cams,
+):
+    """
+    Top-down reconstruction in pre-order; ties go to the smallest state index.
+    Sets cams[v] = 1 for every node of the trees in `order` that gets a camera
+    (cams must start zeroed). `order` may be any run of whole trees.
+    """
+    cdef int n = parent.shape[0]
+    cdef int k, i, v, c, s, cs, m01
+    cdef unsigned char* state = <unsigned char*>malloc(n + 1)
+    if state == NULL:
+        raise MemoryError()
+    try:
+        for k in range(order.shape[0]):
+            v = order[k]
+            if parent[v] == -1:
+                state[v] = 0 if dp0[v] <= dp1[v] else 1
+            s = state[v]
+            if s == 0:
+                cams[v] = 1
+            for i in range(indptr[v], indptr[v + 1]):
+                c = indices[i]
+                if parent[c] != v:
+                    continue
+                m01 = dp0[c] if dp0[c] < dp1[c] else dp1[c]
+                if s == 1 and c == best_child[v]:
+                    cs = 0
+                elif dp0[c] <= dp1[c]:
+                    cs = 0
+                else:
+                    cs = 1
+                if s == 0 and dp2[c] < m01:
+                    cs = 2
+                state[c] = cs
+    finally:
+        free(state)
@@ -10,26 +10,34 @@ We generate:
 
 from __future__ import annotations
 
+import pickle
 import random
 import time
-import statistics
-from typing import Dict, Iterable, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-from vertex_cover_dp import solve_vertex_cover_dp
+import numpy as np
+
+from vertex_cover_numba import solve_vertex_cover_dp
 
 
 Edge = Tuple[int, int]
+Solution = Tuple[int, Set[int]]
+
+# Written by the benchmark run so generate_benchmark_outputs.py can reuse the
+# solutions instead of solving every instance a second time.
+SOLUTION_CACHE_PATH = "bench_cache.pkl"
 
 
 def normalize_edges(edges: Iterable[Edge]) -> List[Edge]:
-    s = set()
-    for u, v in edges:
-        if u == v:
-            continue
-        if u > v:
-            u, v = v, u
-        s.add((u, v))
-    return sorted(s)
+    """Drop self-loops and duplicates; return sorted (u, v) pairs with u < v."""
+    a = np.fromiter((x for e in edges for x in e), dtype=np.int32).reshape(-1, 2)
+    a = a[a[:, 0] != a[:, 1]]
+    lo = np.minimum(a[:, 0], a[:, 1])
+    hi = np.maximum(a[:, 0], a[:, 1])
+    # np.unique over rows sorts lexicographically, exactly like sorted() on tuples
+    pairs = np.unique(np.stack([lo, hi], axis=1), axis=0)
+    return list(zip(pairs[:, 0].tolist(), pairs[:, 1].tolist()))
 
 
 def gen_cycle(n: int) -> List[Edge]:
@@ -40,13 +48,30 @@ def gen_path(n: int) -> List[Edge]:
     return [(i, i + 1) for i in range(n - 1)]
 
 
+def _bernoulli_positions(rng: np.random.Generator, total: int, p: float) -> np.ndarray:
+    """
+    Positions in [0, total) kept independently with probability p.
+    Instead of one coin flip per position, sample the geometric gaps between
+    kept positions, so the work is proportional to the number of hits.
+    """
+    if total <= 0 or p <= 0:
+        return np.empty(0, dtype=np.int64)
+    gaps = rng.geometric(p, size=int(2 * total * p) + 16)
+    pos = np.cumsum(gaps) - 1
+    while pos[-1] < total:
+        more = rng.geometric(p, size=int(total * p) + 16)
+        pos = np.concatenate([pos, pos[-1] + np.cumsum(more)])
+    return pos[pos < total]
+
+
 def gen_random_gnp(n: int, p: float, seed: int) -> List[Edge]:
-    rnd = random.Random(seed)
-    edges = []
-    for i in range(n):
-        for j in range(i + 1, n):
-            if rnd.random() < p:
-                edges.append((i, j))
+    rng = np.random.default_rng(seed)
+    total = n * (n - 1) // 2
+    k = _bernoulli_positions(rng, total, p)
+    # Invert the row-major enumeration of pairs i < j: index k -> (i, j)
+    i = (n - 2 - np.floor(np.sqrt(-8 * k + 4 * n * (n - 1) - 7) / 2 - 0.5)).astype(np.int64)
+    j = k + i + 1 - total + (n - i) * ((n - i) - 1) // 2
+    edges = list(zip(i.tolist(), j.tolist()))
     # Ensure not empty too often: if empty, add one random edge
     if n >= 2 and not edges:
         edges.append((0, 1))
@@ -54,13 +79,13 @@ def gen_random_gnp(n: int, p: float, seed: int) -> List[Edge]:
 
 
 def gen_bipartite(n_left: int, n_right: int, p: float, seed: int) -> List[Edge]:
-    rnd = random.Random(seed)
-    edges = []
+    rng = np.random.default_rng(seed)
     offset = n_left
-    for i in range(n_left):
-        for j in range(n_right):
-            if rnd.random() < p:
-                edges.append((i, offset + j))
+    # The n_left x n_right grid is tiny and the densities are high (p >= 0.2),
+    # so one Bernoulli mask over the whole grid is cheaper than gap sampling.
+    pairs = np.argwhere(rng.random((n_left, n_right)) < p)
+    pairs[:, 1] += offset
+    edges = list(zip(pairs[:, 0].tolist(), pairs[:, 1].tolist()))
     if (n_left + n_right) >= 2 and not edges:
         edges.append((0, offset))
     return normalize_edges(edges)
@@ -114,20 +139,41 @@ def generate_benchmark_instances(
     return instances
 
 
-def time_solve(n: int, edges: List[Edge]) -> float:
+def _warm_up() -> None:
+    """Trigger (or load the cached) JIT compilation outside any timed region."""
+    solve_vertex_cover_dp(3, [(0, 1), (1, 2)])
+
+
+def time_solve(n: int, edges: List[Edge]) -> Tuple[float, Solution]:
+    # Runs inside a worker process, so the timing excludes pickling/IPC.
     start = time.perf_counter()
-    solve_vertex_cover_dp(n, edges)
+    result = solve_vertex_cover_dp(n, edges)
     end = time.perf_counter()
-    return end - start
+    return end - start, result
 
 
-def run_benchmark(instances: List[Tuple[str, int, List[Edge]]]) -> Dict[int, List[float]]:
+def run_benchmark(
+    instances: List[Tuple[str, int, List[Edge]]],
+    solutions: Optional[List[Solution]] = None,
+    workers: Optional[int] = None,
+) -> Dict[int, List[float]]:
+    """
+    Time every instance and group the times by n.
+    Instances are independent, so they are solved on a process pool with
+    `workers` processes (default: one per CPU core).
+    If `solutions` is given, the (size, cover) of each instance is appended to it
+    in instance order, so the results can be cached without re-solving.
+    """
     times_by_size: Dict[int, List[float]] = {}
-    for idx, (_name, n, edges) in enumerate(instances, 1):
-        t = time_solve(n, edges)
-        times_by_size.setdefault(n, []).append(t)
-        if idx % 50 == 0:
-            print(f"Processed {idx}/{len(instances)} instances...")
+    sizes = [n for _name, n, _edges in instances]
+    edge_lists = [edges for _name, _n, edges in instances]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_up) as pool:
+        for idx, (n, (t, result)) in enumerate(zip(sizes, pool.map(time_solve, sizes, edge_lists)), 1):
+            times_by_size.setdefault(n, []).append(t)
+            if solutions is not None:
+                solutions.append(result)
+            if idx % 50 == 0:
+                print(f"Processed {idx}/{len(instances)} instances...")
     return times_by_size
 
 
@@ -136,8 +182,38 @@ def write_results(times_by_size: Dict[int, List[float]], out_path: str = "benchm
     with open(out_path, "w") as f:
         f.write("n\tk\tavg_s\tmin_s\tmax_s\n")
         for n in sizes:
-            ts = times_by_size[n]
-            f.write(f"{n}\t{len(ts)}\t{statistics.mean(ts)}\t{min(ts)}\t{max(ts)}\n")
+            ts = np.fromiter(times_by_size[n], dtype=np.float64, count=len(times_by_size[n]))
+            f.write(f"{n}\t{len(ts)}\t{float(ts.mean())}\t{float(ts.min())}\t{float(ts.max())}\n")
+
+
+def save_solution_cache(
+    instances: List[Tuple[str, int, List[Edge]]],
+    solutions: List[Solution],
+    path: str = SOLUTION_CACHE_PATH,
+) -> None:
+    """Pickle the benchmark instances together with their solved covers."""
+    with open(path, "wb") as f:
+        pickle.dump({"instances": instances, "solutions": solutions}, f)
+
+
+def load_solution_cache(
+    instances: List[Tuple[str, int, List[Edge]]],
+    path: str = SOLUTION_CACHE_PATH,
+) -> Optional[List[Solution]]:
+    """
+    Return the cached solutions of a previous benchmark run, or None.
+    The cache is only used if it was made for exactly `instances`: a file left
+    over from an older generator would otherwise pair stale instances with
+    the suite being written. A missing, truncated or foreign file is a miss too.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        if not isinstance(data, dict) or data["instances"] != instances:
+            return None
+        return data["solutions"]
+    except (OSError, EOFError, pickle.UnpicklingError, KeyError, TypeError):
+        return None
 
 
 if __name__ == "__main__":
@@ -145,8 +221,11 @@ if __name__ == "__main__":
     sizes = list(range(10, 30))  # 10..29 (20 sizes)
     instances = generate_benchmark_instances(sizes, instances_per_size=10)
     print(f"Total instances: {len(instances)} (sizes: {len(sizes)})")
-    times = run_benchmark(instances)
+    solutions: List[Solution] = []
+    times = run_benchmark(instances, solutions)
     write_results(times)
+    save_solution_cache(instances, solutions)
     print("Wrote benchmark_results_vc.txt")
+    print(f"Cached solutions in {SOLUTION_CACHE_PATH}")
 
 
@@ -6,8 +6,7 @@ assuming each connected component is a tree with a designated root.
 from __future__ import annotations
 
 from collections import defaultdict
-from math import inf
-from typing import Dict, Iterable, List, Set, Tuple, Optional
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple, Optional
 
 
 def build_adj(n: int, edges: Iterable[Tuple[int, int]]) -> List[List[int]]:
@@ -24,69 +23,209 @@ def build_adj(n: int, edges: Iterable[Tuple[int, int]]) -> List[List[int]]:
     return adj
 
 
-def min_cameras_for_tree(adj: List[List[int]], root: int = 0) -> int:
+def _traversal_order(
+    adj: List[List[int]], root: int, parent: List[int], visited: bytearray
+) -> List[int]:
     """
-    Returns the minimum number of cameras needed to monitor all nodes in a tree.
-    
-    I'm using three states for each node to track different monitoring scenarios:
-      State 0: Camera is placed at this node
-      State 1: No camera here, but at least one child has a camera (node is monitored)
-      State 2: No camera here, node is not yet monitored (must be covered by parent)
-    
-    The key insight: we need to ensure every node is either covered by itself,
-    a child, or a parent. This DP formulation captures all these cases.
+    Iterative pre-order traversal of the tree containing `root`.
+    I'm doing this with an explicit stack instead of recursion so deep trees
+    (e.g. long paths) don't hit Python's recursion limit or pay a call frame
+    per node. Walking `order` backwards visits every child before its parent,
+    which is exactly the post-order the DP needs.
+
+    Fills parent[v] with v's parent (-1 for the root) and sets visited[v] for
+    the nodes of this tree only, so one `parent` list and one `visited` flag
+    array can be shared by every tree of a forest. I'm using a bytearray
+    instead of a set so marking a node is plain indexing, with no hashing.
     """
-    n = len(adj)
-    # dp[v][state] stores the minimum cameras needed for subtree rooted at v
-    # given that v is in the specified state
-    dp: List[List[int]] = [[0, 0, 0] for _ in range(n)]
-
-    def dfs(v: int, parent: int) -> None:
-        """
-        DFS traversal to compute DP values bottom-up.
-        I'm doing post-order traversal so children are processed before parent.
-        """
+    parent[root] = -1
+    order: List[int] = []
+    visited[root] = 1
+    stack = [root]
+    while stack:
+        v = stack.pop()
+        order.append(v)
+        for nb in adj[v]:
+            if not visited[nb]:
+                visited[nb] = 1
+                parent[nb] = v
+                stack.append(nb)
+    return order
+
+
+def _tree_dp(
+    adj: List[List[int]],
+    root: int,
+    parent: List[int],
+    visited: bytearray,
+    dp0: List[int],
+    dp1: List[int],
+    dp2: List[int],
+    best_child: List[int],
+) -> List[int]:
+    """
+    Runs the 3-state DP (see `min_cameras_for_tree`) on the tree containing `root`.
+
+    I'm passing the per-node lists in instead of allocating them here: they are
+    indexed by global node id, so the forest functions allocate them once and
+    reuse them for every component. Allocating n-sized lists per component would
+    cost O(n * components) on forests with many small trees.
+
+    Only entries of this tree's nodes are written. Returns the pre-order.
+    """
+    # A subtree never needs more than n cameras, so n + 1 marks "impossible".
+    # I'm using an int sentinel so the whole DP stays in integer arithmetic.
+    INF = len(adj) + 1
+
+    order = _traversal_order(adj, root, parent, visited)
+
+    # Compute DP values bottom-up: reversed pre-order puts children before parent
+    for v in reversed(order):
+        nbrs = adj[v]
+        pv = parent[v]  # Read once instead of once per neighbor
+
+        # Leaves have no children, so their values are constants. I'm setting
+        # them directly: on random trees a large share of nodes are leaves, and
+        # this skips the accumulator setup and the child loop for all of them.
+        # (A root with one neighbor is not a leaf: that neighbor is its child.)
+        deg = len(nbrs)
+        if deg == 0 or (deg == 1 and pv >= 0):
+            dp0[v] = 1
+            dp1[v] = INF  # no child can cover a leaf
+            dp2[v] = 0
+            best_child[v] = -1
+            continue
+
         # Base case: if we place a camera at v, cost is 1
-        dp[v][0] = 1
-        # Initially, state 1 is impossible (no children processed yet)
-        dp[v][1] = inf
+        acc0 = 1
         # State 2: no camera at v, waiting for parent (cost 0 for v itself)
-        dp[v][2] = 0
+        acc2 = 0
 
         # For state 1, I need to track the minimum "extra cost" of placing
         # a camera in at least one child. This is why I use base and gain.
         base = 0  # Base cost if all children are in state 0 or 1
-        gain = inf  # Minimum extra cost to ensure at least one child has a camera
-        
-        for c in adj[v]:
-            if c == parent:
+        gain = INF  # Minimum extra cost to ensure at least one child has a camera
+        best = -1  # Child that provides that minimal gain (used by reconstruction)
+
+        for c in nbrs:
+            if c == pv:
                 continue  # Skip parent to avoid going back up the tree
-            
-            # Process child first (post-order)
-            dfs(c, v)
 
-            # For state 0: if v has a camera, children can be in any state
-            m02 = min(dp[c][0], dp[c][1], dp[c][2])
+            # Child c was already processed (it comes later in pre-order)
+            c0 = dp0[c]
+            c1 = dp1[c]
+            c2 = dp2[c]
+
             # For state 2: if v waits for parent, children must be self-sufficient
             # (state 0 or 1, but not 2, since v can't help them)
-            m01 = min(dp[c][0], dp[c][1])
-            
-            dp[v][0] += m02
-            dp[v][2] += m01
+            # I'm using conditional expressions instead of min() calls: this runs
+            # once per edge, and min() pays a builtin call (plus a tuple for 3 args).
+            m01 = c0 if c0 < c1 else c1
+            # For state 0: if v has a camera, children can be in any state
+            m02 = m01 if m01 < c2 else c2
+
+            acc0 += m02
+            acc2 += m01
 
             # For state 1: we need at least one child in state 0
             # base is the cost if we assume all children are in state 0 or 1
             base += m01
             # gain tracks the minimum extra cost to force one child into state 0
-            gain = min(gain, dp[c][0] - m01)
+            child_gain = c0 - m01
+            if child_gain < gain:
+                gain = child_gain
+                best = c
+
+        dp0[v] = acc0
+        dp2[v] = acc2
+        # If v has children, state 1 is achievable; otherwise it stays impossible
+        dp1[v] = base + gain if best >= 0 else INF
+        best_child[v] = best
+
+    return order
+
+
+def _reconstruct(
+    adj: List[List[int]],
+    root: int,
+    dp0: List[int],
+    dp1: List[int],
+    dp2: List[int],
+    best_child: List[int],
+    cameras: Set[int],
+) -> None:
+    """
+    Walks the tree containing `root` top-down after `_tree_dp` and adds the
+    nodes that get a camera in an optimal placement to `cameras`.
+    I'm using an explicit stack of (node, parent, state) entries, like the
+    DP traversal, so deep trees don't hit Python's recursion limit.
+
+    Each child's state is the argmin over its allowed states, written inline as
+    chained `<=` tests so ties go to the smallest state index (deterministic)
+    without building tuples or calling a helper per node.
+    """
+    root_state = 0 if dp0[root] <= dp1[root] else 1  # root cannot be in state 2
+    stack = [(root, -1, root_state)]
+    while stack:
+        v, parent, state = stack.pop()
+
+        # State 0 => camera at v
+        if state == 0:
+            cameras.add(v)
+            for c in adj[v]:
+                if c == parent:
+                    continue
+                c0 = dp0[c]
+                c1 = dp1[c]
+                c2 = dp2[c]
+                stack.append((c, v, 0 if c0 <= c1 and c0 <= c2 else (1 if c1 <= c2 else 2)))
+            continue
 
-        # If v has children, state 1 is achievable
-        if gain < inf:
-            dp[v][1] = base + gain
+        # State 2 => v is waiting for parent, so children must be self-sufficient (0 or 1)
+        if state == 2:
+            for c in adj[v]:
+                if c == parent:
+                    continue
+                stack.append((c, v, 0 if dp0[c] <= dp1[c] else 1))
+            continue
+
+        # State 1 => v is dominated by at least one child camera
+        # We enforce exactly one "forced" child into state 0 (chosen during DP),
+        # and the remaining children can be in min(0,1).
+        forced = best_child[v]
+        for c in adj[v]:
+            if c == parent:
+                continue
+            if c == forced:
+                stack.append((c, v, 0))
+            else:
+                stack.append((c, v, 0 if dp0[c] <= dp1[c] else 1))
+
+
+def min_cameras_for_tree(adj: List[List[int]], root: int = 0) -> int:
+    """
+    Returns the minimum number of cameras needed to monitor all nodes in a tree.
+    
+    I'm using three states for each node to track different monitoring scenarios:
+      State 0: Camera is placed at this node
+      State 1: No camera here, but at least one child has a camera (node is monitored)
+      State 2: No camera here, node is not yet monitored (must be covered by parent)
+    
+    The key insight: we need to ensure every node is either covered by itself,
+    a child, or a parent. This DP formulation captures all these cases.
+    """
+    n = len(adj)
+    # dp0[v], dp1[v], dp2[v] store the minimum cameras needed for subtree rooted
+    # at v given that v is in state 0, 1 or 2. I'm keeping one flat list per state
+    # (instead of a [s0, s1, s2] list per node) so each read is a single index
+    # and there are no n small list allocations.
+    dp0: List[int] = [0] * n
+    dp1: List[int] = [0] * n
+    dp2: List[int] = [0] * n
+    _tree_dp(adj, root, [-1] * n, bytearray(n), dp0, dp1, dp2, [-1] * n)
 
-    dfs(root, -1)
     # Root must be monitored (can't wait for parent), so only states 0 and 1 are valid
-    return min(dp[root][0], dp[root][1])
+    return min(dp0[root], dp1[root])
 
 
 def min_cameras_for_tree_with_solution(adj: List[List[int]], root: int = 0) -> Tuple[int, Set[int]]:
@@ -101,138 +240,141 @@ def min_cameras_for_tree_with_solution(adj: List[List[int]], root: int = 0) -> T
       (min_camera_count, camera_nodes_set)
     """
     n = len(adj)
-    dp: List[List[float]] = [[0.0, 0.0, 0.0] for _ in range(n)]
+    dp0: List[int] = [0] * n
+    dp1: List[int] = [0] * n
+    dp2: List[int] = [0] * n
     # For state 1, we must force at least one child into state 0.
-    # This array remembers *which* child provides the minimal "gain".
-    best_child_for_state1: List[Optional[int]] = [None] * n
+    # This list remembers *which* child provides the minimal "gain" (-1 if none).
+    best_child: List[int] = [-1] * n
+    _tree_dp(adj, root, [-1] * n, bytearray(n), dp0, dp1, dp2, best_child)
 
-    def dfs(v: int, parent: int) -> None:
-        dp[v][0] = 1.0
-        dp[v][1] = inf
-        dp[v][2] = 0.0
+    cameras: Set[int] = set()
+    _reconstruct(adj, root, dp0, dp1, dp2, best_child, cameras)
 
-        base = 0.0
-        gain = inf
-        best_child = None
+    return min(dp0[root], dp1[root]), cameras
 
-        for c in adj[v]:
-            if c == parent:
-                continue
-            dfs(c, v)
 
-            m02 = min(dp[c][0], dp[c][1], dp[c][2])
-            m01 = min(dp[c][0], dp[c][1])
+def _find(uf: List[int], x: int) -> int:
+    """
+    Union-find lookup with path halving: every node on the way up is pointed
+    at its grandparent, which keeps later lookups short.
+    """
+    while uf[x] != x:
+        uf[x] = uf[uf[x]]
+        x = uf[x]
+    return x
 
-            dp[v][0] += m02
-            dp[v][2] += m01
 
-            base += m01
-            child_gain = dp[c][0] - m01
-            if child_gain < gain:
-                gain = child_gain
-                best_child = c
-
-        if best_child is not None:
-            dp[v][1] = base + gain
-            best_child_for_state1[v] = best_child
-
-    def argmin_state(values: List[float], allowed_states: Tuple[int, ...]) -> int:
-        """Deterministic tie-breaking: pick the smallest state index among minima."""
-        best_s = allowed_states[0]
-        best_v = values[best_s]
-        for s in allowed_states[1:]:
-            if values[s] < best_v - 1e-12 or (abs(values[s] - best_v) <= 1e-12 and s < best_s):
-                best_s = s
-                best_v = values[s]
-        return best_s
-
-    cameras: Set[int] = set()
+def _components(adj: List[List[int]]) -> Tuple[List[int], Dict[int, List[int]]]:
+    """
+    Groups the nodes into connected components with a union-find
+    (path compression + union by rank).
+    I'm doing this instead of a BFS with a `seen` set so component detection is
+    plain list indexing, with no hashing of node ids.
 
-    def recon(v: int, parent: int, state: int) -> None:
-        # State 0 => camera at v
-        if state == 0:
-            cameras.add(v)
-            for c in adj[v]:
-                if c == parent:
-                    continue
-                cs = argmin_state(dp[c], (0, 1, 2))
-                recon(c, v, cs)
-            return
+    Returns:
+      (uf, comps) where comps maps each component's representative to its nodes
+      in ascending order, ordered by the component's smallest node
+    """
+    n = len(adj)
+    uf = list(range(n))
+    rank = [0] * n
+    for u in range(n):
+        for v in adj[u]:
+            if v < u:
+                continue  # Every edge shows up twice in adj; union it once
+            ru = _find(uf, u)
+            rv = _find(uf, v)
+            if ru == rv:
+                continue
+            if rank[ru] < rank[rv]:
+                ru, rv = rv, ru
+            uf[rv] = ru
+            if rank[ru] == rank[rv]:
+                rank[ru] += 1
 
-        # State 2 => v is waiting for parent, so children must be self-sufficient (0 or 1)
-        if state == 2:
-            for c in adj[v]:
-                if c == parent:
-                    continue
-                cs = argmin_state(dp[c], (0, 1))
-                recon(c, v, cs)
-            return
+    comps: Dict[int, List[int]] = defaultdict(list)
+    for v in range(n):
+        comps[_find(uf, v)].append(v)
+    return uf, comps
 
-        # State 1 => v is dominated by at least one child camera
-        # We enforce exactly one "forced" child into state 0 (chosen during DP),
-        # and the remaining children can be in min(0,1).
-        forced = best_child_for_state1[v]
-        for c in adj[v]:
-            if c == parent:
-                continue
-            if forced is not None and c == forced:
-                recon(c, v, 0)
-            else:
-                cs = argmin_state(dp[c], (0, 1))
-                recon(c, v, cs)
 
-    dfs(root, -1)
-    root_state = argmin_state(dp[root], (0, 1))  # root cannot be in state 2
-    recon(root, -1, root_state)
+def _forest_impl(
+    n: int,
+    edges: Iterable[Tuple[int, int]],
+    roots: Iterable[int] | None,
+    adj: Optional[List[List[int]]],
+    reconstruct: bool,
+) -> Tuple[int, Set[int]]:
+    """
+    Shared body of `min_cameras_forest` and `min_cameras_forest_with_solution`.
+    I'm keeping a single copy of the component/root handling; the only
+    difference between the two is whether the camera set is reconstructed
+    (`reconstruct=False` leaves the returned set empty).
+    """
+    if adj is None:
+        adj = build_adj(n, edges)
+    total = 0
+    cameras: Set[int] = set()
+    # I'm allocating the per-node DP buffers once for the whole forest; each
+    # component only touches its own entries, so they can be shared.
+    parent: List[int] = [-1] * n
+    visited = bytearray(n)
+    dp0: List[int] = [0] * n
+    dp1: List[int] = [0] * n
+    dp2: List[int] = [0] * n
+    best_child: List[int] = [-1] * n
+    # If user specified roots, I'll use them when available. Only membership
+    # matters, so a frozenset is enough (no dict of r -> r).
+    root_set: FrozenSet[int] = frozenset(roots) if roots is not None else frozenset()
+
+    # Find all connected components, then process each one separately
+    uf, comps = _components(adj)
+    # I'm resolving the specified roots to their components in one pass over
+    # root_set (keeping the smallest root per component), so picking a root
+    # below is a dict lookup instead of a scan of the whole component.
+    root_of_comp: Dict[int, int] = {}
+    for r in root_set:
+        if 0 <= r < n:
+            c = _find(uf, r)
+            if r < root_of_comp.get(c, n):
+                root_of_comp[c] = r
+
+    for rep, component in comps.items():
+        # Use specified root if available, otherwise use first node. Without
+        # any roots (the common case) I'm skipping the lookup altogether.
+        root = root_of_comp.get(rep, component[0]) if root_of_comp else component[0]
+        # Add cameras needed for this component (root can't be in state 2)
+        _tree_dp(adj, root, parent, visited, dp0, dp1, dp2, best_child)
+        total += min(dp0[root], dp1[root])
+        if reconstruct:
+            _reconstruct(adj, root, dp0, dp1, dp2, best_child, cameras)
 
-    return int(min(dp[root][0], dp[root][1])), cameras
+    return total, cameras
 
 
 def min_cameras_forest_with_solution(
-    n: int, edges: Iterable[Tuple[int, int]], roots: Iterable[int] | None = None
+    n: int,
+    edges: Iterable[Tuple[int, int]],
+    roots: Iterable[int] | None = None,
+    adj: Optional[List[List[int]]] = None,
 ) -> Tuple[int, Set[int]]:
     """
     Forest version that also returns the selected camera cdps.
+    Pass `adj` (from `build_adj`) to reuse an adjacency list across calls;
+    `edges` is ignored then.
 
     Returns:
       (total_min_camera_count, set_of_camera_nodes)
     """
-    adj = build_adj(n, edges)
-    seen: Set[int] = set()
-    total = 0
-    cameras: Set[int] = set()
-    root_map: Dict[int, int] = defaultdict(int)
-    if roots is not None:
-        for r in roots:
-            root_map[r] = r
-
-    def collect_component(start: int) -> List[int]:
-        stack = [start]
-        comp = []
-        seen.add(start)
-        while stack:
-            v = stack.pop()
-            comp.append(v)
-            for nb in adj[v]:
-                if nb not in seen:
-                    seen.add(nb)
-                    stack.append(nb)
-        return comp
-
-    for v in range(n):
-        if v in seen:
-            continue
-        component = collect_component(v)
-        root = next((r for r in component if r in root_map), component[0])
-        cnt, cams = min_cameras_for_tree_with_solution(adj, root)
-        total += cnt
-        cameras |= cams
-
-    return total, cameras
+    return _forest_impl(n, edges, roots, adj, reconstruct=True)
 
 
 def min_cameras_forest(
-    n: int, edges: Iterable[Tuple[int, int]], roots: Iterable[int] | None = None
+    n: int,
+    edges: Iterable[Tuple[int, int]],
+    roots: Iterable[int] | None = None,
+    adj: Optional[List[List[int]]] = None,
 ) -> int:
     """
     Computes minimum cameras for a forest (multiple connected components).
@@ -245,45 +387,11 @@ def min_cameras_forest(
       edges  : list of edges
       roots  : optional list of root nodes for each component. If not provided,
                I'll pick the first node in each component as root.
+      adj    : optional prebuilt adjacency from `build_adj(n, edges)`. I'm letting
+               callers that solve the same graph more than once (e.g. count and
+               solution) build it once; `edges` is ignored when it is given.
     """
-    adj = build_adj(n, edges)
-    seen: Set[int] = set()  # Track visited nodes to find components
-    total = 0
-    root_map: Dict[int, int] = defaultdict(int)
-    if roots is not None:
-        # If user specified roots, I'll use them when available
-        for r in roots:
-            root_map[r] = r
-
-    def collect_component(start: int) -> List[int]:
-        """
-        BFS to collect all nodes in the same connected component.
-        I'm using iterative BFS with a stack to avoid recursion depth issues.
-        """
-        stack = [start]
-        comp = []
-        seen.add(start)
-        while stack:
-            v = stack.pop()
-            comp.append(v)
-            for nb in adj[v]:
-                if nb not in seen:
-                    seen.add(nb)
-                    stack.append(nb)
-        return comp
-
-    # Process each connected component separately
-    for v in range(n):
-        if v in seen:
-            continue  # Already processed this component
-        
-        # Find all nodes in this component
-        component = collect_component(v)
-        # Use specified root if available, otherwise use first node
-        root = next((r for r in component if r in root_map), component[0])
-        # Add cameras needed for this component
-        total += min_cameras_for_tree(adj, root)
-
+    total, _ = _forest_impl(n, edges, roots, adj, reconstruct=False)
     return total
 
 
@@ -294,8 +402,8 @@ if __name__ == "__main__":
     # Total: 2 cameras
     edges = [(0, 1), (1, 2), (3, 4), (4, 5)]
     n = 6
-    result = min_cameras_forest(n, edges)
-    result_with_set, cams = min_cameras_forest_with_solution(n, edges)
+    # The solution variant already returns the count, so one call is enough
+    result, cams = min_cameras_forest_with_solution(n, edges)
     print(f"Minimum number of cameras needed: {result}")
     print(f"Selected camera cdps (nodes): {sorted(cams)}")
 
@@ -0,0 +1,421 @@
+"""
+Numba-compiled version of the forest DP from `dp_forest.py`.
+
+The benchmark calls the solver thousands of times, so I'm moving the whole
+per-instance pipeline (adjacency construction, traversal, the 3-state DP and
+the camera reconstruction) into jitted functions that work on int32 arrays:
+`_build_csr` turns endpoint arrays into a CSR adjacency, `_order_kernel`
+computes the traversal order and parents, `_dp_kernel` fills the DP tables
+and `_recon_kernel` picks the cameras. The DP itself is exactly the one documented in
+`min_cameras_for_tree`; only the execution model changes.
+
+Numba is optional: without it, the kernels come from the `_dp_kernel` Cython
+extension if it has been built (`cythonize -i _dp_kernel.pyx`). With neither,
+the public functions below simply delegate to the pure-Python implementation
+in `dp_forest.py` (or, when handed a prebuilt CSR, run the same kernels
+uncompiled via the `*_py` functions).
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+import dp_forest
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAVE_NUMBA = False
+
+try:
+    # Ahead-of-time Cython build of the same kernels (see _dp_kernel.pyx)
+    import _dp_kernel as _dp_ext
+    HAVE_DP_EXT = True
+except ImportError:  # pragma: no cover - only present after `cythonize -i`
+    HAVE_DP_EXT = False
+
+
+def _build_csr(n: int, u_arr: np.ndarray, v_arr: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Adjacency in CSR form from edge endpoints u_arr[i] - v_arr[i].
+    Neighbors of v are indices[indptr[v]:indptr[v+1]], kept in edge-list order.
+    """
+    m = u_arr.shape[0]
+    indptr = np.zeros(n + 1, np.int32)
+    for i in range(m):
+        indptr[u_arr[i] + 1] += 1
+        indptr[v_arr[i] + 1] += 1
+    for v in range(n):
+        indptr[v + 1] += indptr[v]
+    indices = np.empty(2 * m, np.int32)
+    cursor = indptr[:n].copy()
+    for i in range(m):
+        u = u_arr[i]
+        v = v_arr[i]
+        indices[cursor[u]] = v
+        cursor[u] += 1
+        indices[cursor[v]] = u
+        cursor[v] += 1
+    return indptr, indices
+
+
+def _order_kernel_py(indptr: np.ndarray, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Iterative pre-order of every tree in the forest, trees one after another.
+    Each tree is rooted at its smallest node, like `min_cameras_forest`.
+    Returns:
+      (order, parent) where parent[v] == -1 iff v is a root
+    """
+    n = indptr.shape[0] - 1
+    parent = np.full(n, -1, np.int32)
+    visited = np.zeros(n, np.uint8)
+    order = np.empty(n, np.int32)
+    stack = np.empty(n, np.int32)
+    count = 0
+    for root in range(n):
+        if visited[root]:
+            continue
+        top = 1
+        stack[0] = root
+        visited[root] = 1
+        while top > 0:
+            top -= 1
+            v = stack[top]
+            order[count] = v
+            count += 1
+            for i in range(indptr[v], indptr[v + 1]):
+                c = indices[i]
+                if not visited[c]:
+                    visited[c] = 1
+                    parent[c] = v
+                    stack[top] = c
+                    top += 1
+    return order, parent
+
+
+def _dp_kernel_py(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    order: np.ndarray,
+    parent: np.ndarray,
+    dp0: np.ndarray,
+    dp1: np.ndarray,
+    dp2: np.ndarray,
+    best_child: np.ndarray,
+) -> int:
+    """
+    Bottom-up 3-state DP (see `dp_forest.min_cameras_for_tree` for the states).
+    Walking `order` backwards visits children before parents in every tree.
+
+    `order` may be any run of whole trees from `_order_kernel`; the dp arrays are
+    indexed by node id and only the entries of those trees are written, so
+    disjoint runs can be solved concurrently into the same arrays.
+    Returns the minimum camera count of those trees.
+    """
+    inf = parent.shape[0] + 1  # more cameras than nodes is impossible
+    total = 0
+    for k in range(order.shape[0] - 1, -1, -1):
+        v = order[k]
+        a0 = 1
+        a2 = 0
+        base = 0
+        gain = inf
+        best = -1
+        for i in range(indptr[v], indptr[v + 1]):
+            c = indices[i]
+            if parent[c] != v:
+                continue
+            m01 = min(dp0[c], dp1[c])
+            a0 += min(m01, dp2[c])
+            a2 += m01
+            base += m01
+            # Select instead of branch, so LLVM can emit conditional moves
+            g = dp0[c] - m01
+            better = g < gain
+            gain = g if better else gain
+            best = c if better else best
+        dp0[v] = a0
+        dp2[v] = a2
+        dp1[v] = base + gain if best >= 0 else inf
+        best_child[v] = best
+        if parent[v] == -1:
+            # Root must be monitored, so only states 0 and 1 count
+            total += min(dp0[v], dp1[v])
+    return total
+
+
+# Nodes with more children than this get their child reduction done with NumPy
+# in `_dp_kernel_np`; below it, the per-call overhead outweighs the loop.
+_VECTOR_MIN_CHILDREN = 8
+
+
+def _dp_kernel_np(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    order: np.ndarray,
+    parent: np.ndarray,
+    dp0: np.ndarray,
+    dp1: np.ndarray,
+    dp2: np.ndarray,
+    best_child: np.ndarray,
+) -> int:
+    """
+    Uncompiled stand-in for `_dp_kernel_py` with the same signature and results.
+
+    Scalar indexing into NumPy arrays is slow from Python, so I'm keeping the
+    three states in one int32[n, 3] table and vectorizing what I can:
+    all leaves are set in one shot, nodes with many children reduce over
+    dp[children] with NumPy, and only the remaining small nodes run a loop
+    over plain Python lists.
+    """
+    n = parent.shape[0]
+    inf = n + 1
+    dp = np.empty((n, 3), np.int32)
+    best = np.full(n, -1, np.int32)
+
+    nchild = np.diff(indptr) - (parent >= 0)
+    leaf = nchild == 0
+    dp[leaf] = (1, inf, 0)
+    leaf_in_run = leaf[order]
+    # A leaf root is an isolated node: it needs its own camera
+    total = int(np.count_nonzero(parent[order[leaf_in_run]] == -1))
+
+    ptr = indptr.tolist()
+    nbr = indices.tolist()
+    par = parent.tolist()
+    for v in reversed(order[~leaf_in_run].tolist()):
+        lo = ptr[v]
+        hi = ptr[v + 1]
+        pv = par[v]
+        if hi - lo > _VECTOR_MIN_CHILDREN:
+            kids = indices[lo:hi]
+            kids = kids[parent[kids] == v]
+            cd = dp[kids].astype(np.int64)
+            m01 = np.minimum(cd[:, 0], cd[:, 1])
+            base = int(m01.sum())
+            g = cd[:, 0] - m01
+            j = int(g.argmin())  # first minimum, like the strict `<` scan
+            dp[v] = (1 + int(np.minimum(m01, cd[:, 2]).sum()), base + int(g[j]), base)
+            best[v] = kids[j]
+        else:
+            a0 = 1
+            base = 0
+            gain = inf
+            b = -1
+            for i in range(lo, hi):
+                c = nbr[i]
+                if c == pv:
+                    continue
+                c0, c1, c2 = dp[c].tolist()
+                m01 = c0 if c0 < c1 else c1
+                a0 += m01 if m01 < c2 else c2
+                base += m01
+                if c0 - m01 < gain:
+                    gain = c0 - m01
+                    b = c
+            dp[v] = (a0, base + gain, base)
+            best[v] = b
+        if pv == -1:
+            total += min(dp[v, 0], dp[v, 1])
+
+    dp0[order] = dp[order, 0]
+    dp1[order] = dp[order, 1]
+    dp2[order] = dp[order, 2]
+    best_child[order] = best[order]
+    return int(total)
+
+
+def _recon_kernel_py(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    order: np.ndarray,
+    parent: np.ndarray,
+    dp0: np.ndarray,
+    dp1: np.ndarray,
+    dp2: np.ndarray,
+    best_child: np.ndarray,
+    cams: np.ndarray,
+) -> None:
+    """
+    Top-down reconstruction in pre-order, so each node's state is fixed before
+    its children are visited. Ties go to the smallest state index.
+    Sets cams[v] = 1 for every node of the trees in `order` that gets a camera.
+    """
+    state = np.zeros(parent.shape[0], np.uint8)
+    for k in range(order.shape[0]):
+        v = order[k]
+        if parent[v] == -1:
+            state[v] = 0 if dp0[v] <= dp1[v] else 1
+        s = state[v]
+        if s == 0:
+            cams[v] = 1
+        for i in range(indptr[v], indptr[v + 1]):
+            c = indices[i]
+            if parent[c] != v:
+                continue
+            if s == 1 and c == best_child[v]:
+                cs = 0
+            elif dp0[c] <= dp1[c]:
+                cs = 0
+            else:
+                cs = 1
+            if s == 0 and dp2[c] < min(dp0[c], dp1[c]):
+                cs = 2
+            state[c] = cs
+
+
+if HAVE_NUMBA:
+    _build_csr = njit(cache=True)(_build_csr)
+    _order_kernel = njit(cache=True)(_order_kernel_py)
+    # nogil lets `workers > 1` run independent trees on several threads
+    _dp_kernel = njit(cache=True, nogil=True)(_dp_kernel_py)
+    _recon_kernel = njit(cache=True, nogil=True)(_recon_kernel_py)
+elif HAVE_DP_EXT:
+    # The extension has the same in-place signatures as the kernels above,
+    # except that the order kernel expects preallocated outputs.
+    def _order_kernel(indptr: np.ndarray, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        n = indptr.shape[0] - 1
+        order = np.empty(n, np.int32)
+        parent = np.full(n, -1, np.int32)
+        _dp_ext.order_kernel(indptr, indices, order, parent)
+        return order, parent
+
+    def _dp_kernel(indptr, indices, order, parent, dp0, dp1, dp2, best_child) -> int:
+        return _dp_ext.dp_kernel(
+            indptr, indices, order, parent, dp0, dp1, dp2, best_child, parent.shape[0] + 1
+        )
+
+    _recon_kernel = _dp_ext.recon_kernel
+else:
+    # Same kernels, uncompiled; only reached when a caller passes csr=
+    _order_kernel = _order_kernel_py
+    _dp_kernel = _dp_kernel_np
+    _recon_kernel = _recon_kernel_py
+
+
+def _edge_array(edges) -> np.ndarray:
+    """
+    Edges as an (m, 2) int32 array. Any iterable of pairs is accepted:
+    np.asarray can't consume a generator, so anything that isn't already an
+    array is materialized as a list first.
+    """
+    if not isinstance(edges, np.ndarray):
+        edges = list(edges)
+    return np.asarray(edges, dtype=np.int32).reshape(-1, 2)
+
+
+def to_csr(n: int, edges: Iterable[Tuple[int, int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized CSR construction, for callers that want to build the adjacency
+    once (e.g. outside a timed region) and pass it in via `csr=`.
+    Neighbor order matches `dp_forest.build_adj`: edge-list order.
+    """
+    e = _edge_array(edges)
+    # Interleave (u, v) and (v, u) per edge so a stable sort keeps edge order
+    src = e.ravel()
+    dst = e[:, ::-1].ravel()
+    order = np.argsort(src, kind="stable")
+    indices = dst[order]
+    counts = np.bincount(src, minlength=n)
+    indptr = np.concatenate([[0], np.cumsum(counts)]).astype(np.int32)
+    return indptr, indices
+
+
+def _csr(n: int, edges, csr) -> Tuple[np.ndarray, np.ndarray]:
+    if csr is None:
+        if not HAVE_NUMBA:
+            return to_csr(n, edges)
+        arr = _edge_array(edges)
+        csr = _build_csr(n, np.ascontiguousarray(arr[:, 0]), np.ascontiguousarray(arr[:, 1]))
+    # The compiled kernels expect contiguous int32 (no copy if already so)
+    indptr, indices = csr
+    return np.ascontiguousarray(indptr, np.int32), np.ascontiguousarray(indices, np.int32)
+
+
+def _tree_runs(order: np.ndarray, parent: np.ndarray, parts: int) -> List[np.ndarray]:
+    """
+    Splits the forest pre-order into at most `parts` runs of whole trees with
+    roughly equal node counts. Every tree is contiguous in `order` and starts at
+    its root, so a run boundary is snapped to the next root position.
+    """
+    n = order.shape[0]
+    starts = np.flatnonzero(parent[order] == -1)
+    targets = (np.arange(1, parts) * n) // parts
+    cuts = np.unique(starts[np.minimum(np.searchsorted(starts, targets), starts.shape[0] - 1)])
+    bounds = [0] + [int(c) for c in cuts if c > 0] + [n]
+    return [order[lo:hi] for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+
+
+def _solve(
+    indptr: np.ndarray, indices: np.ndarray, reconstruct: bool, workers: int
+) -> Tuple[int, Optional[np.ndarray]]:
+    """
+    Runs the kernels over the whole forest.
+
+    Trees are independent, so with `workers > 1` I'm splitting them into runs and
+    solving the runs on a thread pool; the Numba kernels are compiled with
+    nogil=True, so the threads really run in parallel. Each run writes only its
+    own nodes' entries of the shared dp/cams arrays.
+    """
+    n = indptr.shape[0] - 1
+    order, parent = _order_kernel(indptr, indices)
+    dp0 = np.empty(n, np.int32)
+    dp1 = np.empty(n, np.int32)
+    dp2 = np.empty(n, np.int32)
+    best_child = np.empty(n, np.int32)
+    cams = np.zeros(n, np.uint8) if reconstruct else None
+
+    def run(part: np.ndarray) -> int:
+        count = _dp_kernel(indptr, indices, part, parent, dp0, dp1, dp2, best_child)
+        if reconstruct:
+            _recon_kernel(indptr, indices, part, parent, dp0, dp1, dp2, best_child, cams)
+        return count
+
+    if workers > 1 and HAVE_NUMBA and n > 0:
+        runs = _tree_runs(order, parent, workers)
+        with ThreadPoolExecutor(max_workers=len(runs)) as ex:
+            total = sum(ex.map(run, runs))
+    else:
+        total = run(order)
+    return int(total), cams
+
+
+def min_cameras_forest(
+    n: int,
+    edges: Iterable[Tuple[int, int]] = (),
+    csr: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    workers: int = 1,
+) -> int:
+    """
+    Same result as `dp_forest.min_cameras_forest`, compiled when Numba or the
+    `_dp_kernel` extension is available.
+    Pass either `edges` or a prebuilt `csr=(indptr, indices)` from `to_csr`.
+    With Numba, `workers > 1` solves independent trees on that many threads.
+    """
+    if not (HAVE_NUMBA or HAVE_DP_EXT) and csr is None:
+        return dp_forest.min_cameras_forest(n, edges)
+    indptr, indices = _csr(n, edges, csr)
+    total, _ = _solve(indptr, indices, False, workers)
+    return total
+
+
+def min_cameras_forest_with_solution(
+    n: int,
+    edges: Iterable[Tuple[int, int]] = (),
+    csr: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    workers: int = 1,
+) -> Tuple[int, Set[int]]:
+    """
+    Same result as `dp_forest.min_cameras_forest_with_solution`, compiled when
+    Numba or the `_dp_kernel` extension is available.
+    Pass either `edges` or a prebuilt `csr=(indptr, indices)` from `to_csr`.
+    With Numba, `workers > 1` solves independent trees on that many threads.
+    """
+    if not (HAVE_NUMBA or HAVE_DP_EXT) and csr is None:
+        return dp_forest.min_cameras_forest_with_solution(n, edges)
+    indptr, indices = _csr(n, edges, csr)
+    total, cams = _solve(indptr, indices, True, workers)
+    return total, set(np.flatnonzero(cams).tolist())
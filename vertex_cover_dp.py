@@ -16,8 +16,333 @@ but it is an *exact* dynamic programming algorithm with memoization.
 
 from __future__ import annotations
 
-from functools import lru_cache
-from typing import Iterable, List, Set, Tuple
+from typing import Callable, Iterable, List, Set, Tuple
+
+# Population count of a mask. int.bit_count (Python 3.10+) is a single C call
+# (POPCNT where available); older interpreters fall back to counting the "1"s
+# of the binary string.
+_popcount: Callable[[int], int]
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count
+else:  # pragma: no cover - Python < 3.10
+    def _popcount(x: int) -> int:
+        return bin(x).count("1")
+
+# Smallest number of remaining vertices for which reduce_and_pick runs the
+# unconfined-vertex test; below this, branching is cheaper than the test.
+_UNCONFINED_MIN_VERTICES = 50
+
+
+def _mask_bits(mask: int) -> List[int]:
+    """Vertex ids of the set bits in `mask`, ascending."""
+    out: List[int] = []
+    while mask:
+        lsb = mask & -mask
+        out.append(lsb.bit_length() - 1)
+        mask ^= lsb
+    return out
+
+
+def _component_masks(adj: List[int], mask: int) -> List[int]:
+    """
+    Split the vertices of `mask` that have an edge inside `mask` into connected
+    components, one bitmask per component. Each BFS level is expanded at once:
+    the next frontier is the OR of the frontier's adjacency masks.
+    """
+    comps: List[int] = []
+    unvisited = 0
+    rm = mask
+    while rm:
+        lsb = rm & -rm
+        rm ^= lsb
+        if adj[lsb.bit_length() - 1] & mask:
+            unvisited |= lsb
+    while unvisited:
+        comp = frontier = unvisited & -unvisited
+        while frontier:
+            reach = 0
+            while frontier:
+                lsb = frontier & -frontier
+                frontier ^= lsb
+                reach |= adj[lsb.bit_length() - 1]
+            frontier = reach & unvisited & ~comp
+            comp |= frontier
+        unvisited &= ~comp
+        comps.append(comp)
+    return comps
+
+
+def _high_degree_kernel(adj: List[int]) -> Tuple[int, int, int]:
+    """
+    High-degree kernelization of one component (adj in local labels).
+
+    Both endpoints of a greedy maximal matching form a cover, so twice the
+    matching size (and k - 1, for a connected component) is an upper bound
+    `budget` on the minimum cover. A vertex with more than `budget` neighbors
+    is in every minimum cover: leaving it out would take all of them. I'm
+    forcing such vertices and lowering the budget by one for each, until none
+    is left; this strips hubs before the branching ever sees them.
+
+    Returns:
+      (r_mask, forced_mask, budget) where budget >= min cover size of r_mask
+    """
+    k = len(adj)
+    full_mask = (1 << k) - 1
+    rm = full_mask
+    matched = 0
+    while rm:
+        lsb = rm & -rm
+        rm ^= lsb
+        nb = adj[lsb.bit_length() - 1] & rm
+        if nb:
+            rm ^= nb & -nb
+            matched += 1
+    budget = min(2 * matched, k - 1)
+
+    r_mask = full_mask
+    forced = 0
+    changed = True
+    while changed:
+        changed = False
+        for v in _mask_bits(r_mask):
+            if _popcount(adj[v] & r_mask) > budget:
+                forced |= 1 << v
+                r_mask ^= 1 << v
+                budget -= 1
+                changed = True
+    return r_mask, forced, budget
+
+
+def _solve_component(adj: List[int]) -> Tuple[int, int]:
+    """
+    Run the DP described in `solve_vertex_cover_dp` on one connected component
+    in local labels 0..k-1 (adj[i] = bitmask of i's neighbors). Every vertex of
+    a component has an edge, so no isolated-vertex filtering is needed here.
+
+    Returns:
+      (min_size, chosen_mask) with chosen_mask in local labels
+    """
+    # The helpers below take `adj` and `_popcount` as default arguments: their
+    # loops run once per vertex per state, and a default argument is a plain
+    # local (LOAD_FAST) where the closure cell / module global is a slower
+    # LOAD_DEREF / LOAD_GLOBAL on every iteration.
+    # `adj` stays a list of ints even when k <= 64: indexing a list returns the
+    # stored int, while array('Q') / uint64 ndarray reads box a new int on every
+    # access (about 30% / 70% slower here). vertex_cover_numba converts it to a
+    # uint64 ndarray once per component for the compiled kernel instead.
+
+    def is_unconfined(u: int, r_mask: int, adj: List[int] = adj) -> bool:
+        """
+        Unconfined-vertex test (Xiao & Nagamochi; used by Akiba & Iwata's
+        branch-and-reduce solver) inside the subgraph induced by r_mask.
+
+        Grow S = {u}: look for v in N(S) with exactly one neighbor in S. If
+        some such v has no neighbor outside N[S], u is unconfined and some
+        minimum cover contains u. If the fewest such neighbors is exactly one
+        vertex w, add w to S and repeat; otherwise u is confined.
+        """
+        s = 1 << u
+        ns = adj[u] & r_mask  # N(S) \ S
+        while True:
+            closed = ns | s
+            grow = 0
+            rm = ns
+            while rm:
+                lsb = rm & -rm
+                rm ^= lsb
+                nv = adj[lsb.bit_length() - 1] & r_mask
+                in_s = nv & s
+                if in_s & (in_s - 1):
+                    continue  # two or more neighbors in S
+                outside = nv & ~closed
+                if not outside:
+                    return True
+                if not grow and not outside & (outside - 1):
+                    grow = outside
+            if not grow:
+                return False
+            s |= grow
+            ns = (ns | (adj[grow.bit_length() - 1] & r_mask)) & ~s
+
+    def reduce_and_pick(
+        r_mask: int, adj: List[int] = adj, popcount: Callable[[int], int] = _popcount
+    ) -> Tuple[int, int, int, int, int, int]:
+        """
+        Apply the degree-0 / degree-1 / unconfined reductions to r_mask until
+        none fires, then pick the branching vertex of what is left.
+
+        - degree 0: u covers nothing, drop it.
+        - degree 1: some optimal cover takes u's only neighbor w instead of u
+          (w covers a superset of u's edges), so force w and drop both.
+        - unconfined (see `is_unconfined`): force u and drop it. I'm only
+          testing the vertex about to be branched on, once the cheap rules are
+          exhausted and at least _UNCONFINED_MIN_VERTICES remain: if it is
+          unconfined, its N(u) branch is skipped entirely. Testing every vertex,
+          or small masks, cost more than the branches it saved.
+        I'm doing this before branching because it is polynomial and removes
+        pendant vertices for free; on trees it never branches at all.
+
+        Returns:
+          (reduced_mask, forced_mask, forced_count, u, N(u) & reduced_mask, deg(u))
+          where u is a max induced degree vertex (smallest id on ties), deg 0 if none
+        """
+        forced = 0
+        forced_count = 0
+        while True:
+            changed = False
+            best_u, best_nu, best_d = -1, 0, 0
+            rm = r_mask
+            while rm:
+                lsb = rm & -rm
+                rm ^= lsb
+                if not r_mask & lsb:
+                    continue  # already removed by a reduction in this pass
+                u = lsb.bit_length() - 1
+                nu = adj[u] & r_mask
+                if not nu:
+                    r_mask ^= lsb
+                    continue
+                if not nu & (nu - 1):
+                    forced |= nu
+                    forced_count += 1
+                    r_mask &= ~(nu | lsb)
+                    changed = True
+                    continue
+                d = popcount(nu)
+                if d > best_d:
+                    best_u, best_nu, best_d = u, nu, d
+            if changed:
+                continue
+            if best_d and popcount(r_mask) >= _UNCONFINED_MIN_VERTICES and is_unconfined(best_u, r_mask):
+                forced |= 1 << best_u
+                forced_count += 1
+                r_mask ^= 1 << best_u
+                continue
+            # Degrees seen in a pass without removals are still current
+            return r_mask, forced, forced_count, best_u, best_nu, best_d
+
+    def matching_lower_bound(r_mask: int, adj: List[int] = adj) -> int:
+        """
+        Size of a greedy maximal matching inside r_mask. Matched edges share no
+        endpoint, so every cover needs a distinct vertex for each of them: this
+        is a lower bound on the cover size of r_mask.
+        """
+        rm = r_mask
+        m = 0
+        while rm:
+            lsb = rm & -rm
+            rm ^= lsb
+            nb = adj[lsb.bit_length() - 1] & rm
+            if nb:
+                rm ^= nb & -nb
+                m += 1
+        return m
+
+    # I'm memoizing with a plain dict instead of lru_cache: the key is a single
+    # int and nothing is ever evicted, so lru_cache's wrapper and bookkeeping
+    # are pure overhead on every one of the exponentially many calls.
+    # r_mask -> (min cover size of the edges inside r_mask) << 1 | branch, where
+    # branch is 1 if N(u) went into the cover and 0 if u did. I'm packing the
+    # decision into the same int instead of keeping a second dict of
+    # (picked, next_mask) tuples: one lookup per state and no tuple objects.
+    # reduce_and_pick is deterministic, so the replay below recomputes u,
+    # N(u) and the reductions from r_mask.
+    memo: dict[int, int] = {}
+    # r_mask -> best lower bound proven so far for a state that was pruned
+    lower: dict[int, int] = {}
+
+    def dp(r_top: int, ub_top: int) -> int:
+        """
+        Branch-and-bound over the recurrence above. `ub` is the cost the caller
+        already has in hand: any answer >= ub is useless to it.
+        Returns the exact minimum if it is < ub (memoized in `memo` with its
+        branch); otherwise returns some lower bound >= ub.
+
+        I'm running the recursion on an explicit stack instead of Python calls:
+        no frame per state and no recursion limit on deep branches. A pending
+        call is a tuple tagged with its phase:
+          (0, r_mask, ub)                                        not started
+          (1, r_mask, ub, known, r_red, cost, u_bit, nu, d)      "take u" done
+          (2, r_mask, ub, known, cost, d, cu)                    "take N(u)" done
+        `ret` carries the result of the call that just finished to its parent.
+        """
+        stack: List[Tuple[int, ...]] = [(0, r_top, ub_top)]
+        # Everything the loop touches per state, as fast locals
+        push, pop = stack.append, stack.pop
+        memo_get, lower_get = memo.get, lower.get
+        reduce, lower_bound = reduce_and_pick, matching_lower_bound
+        ret = 0
+        while stack:
+            frame = pop()
+            phase = frame[0]
+            if phase == 0:
+                _, r_mask, ub = frame
+                cached = memo_get(r_mask)
+                if cached is not None:
+                    ret = cached >> 1
+                    continue
+                known = lower_get(r_mask, 0)
+                if known >= ub:
+                    ret = known
+                    continue
+                r_red, forced, cost, u, nu, d = reduce(r_mask)
+                if d == 0:
+                    # The reductions covered every edge (or r_mask had none to
+                    # begin with, which this detects in the same pass over r_mask)
+                    memo[r_mask] = cost << 1
+                    ret = cost
+                    continue
+
+                # Prune: even a perfect completion of this state can't beat ub
+                bound = cost + lower_bound(r_red)
+                if bound >= ub:
+                    ret = lower[r_mask] = max(known, bound)
+                    continue
+
+                # Branch: put u in the cover, or leave u out and put all of N(u) in
+                u_bit = 1 << u
+                push((1, r_mask, ub, known, r_red, cost, u_bit, nu, d))
+                push((0, r_red & ~u_bit, ub - cost - 1))
+            elif phase == 1:
+                _, r_mask, ub, known, r_red, cost, u_bit, nu, d = frame
+                cu = cost + 1 + ret
+                # The second branch only matters if it beats both ub and the first branch
+                ub_nu = cu if cu < ub else ub
+                push((2, r_mask, ub, known, cost, d, cu))
+                push((0, r_red & ~(nu | u_bit), ub_nu - cost - d))
+            else:
+                _, r_mask, ub, known, cost, d, cu = frame
+                cn = cost + d + ret
+                # Deterministic tie-break: prefer taking u
+                best_here = cu if cu <= cn else cn
+                if best_here >= ub:
+                    ret = lower[r_mask] = max(known, best_here)
+                else:
+                    memo[r_mask] = (best_here << 1) | (cu > cn)
+                    ret = best_here
+        return ret
+
+    # The kernel's budget bounds the optimum of r_top, so dp is exact there
+    r_top, top_forced, budget = _high_degree_kernel(adj)
+    best = _popcount(top_forced) + dp(r_top, budget + 1)
+
+    # Reconstruct chosen set by replaying decisions from r_top. Every
+    # state on the optimal path was solved exactly, so it is in memo.
+    chosen_mask = top_forced
+    r = r_top
+    while True:
+        r_red, forced, _cost, u, nu, d = reduce_and_pick(r)
+        chosen_mask |= forced
+        if d == 0:
+            break
+        u_bit = 1 << u
+        if memo[r] & 1:
+            chosen_mask |= nu
+            r = r_red & ~(nu | u_bit)
+        else:
+            chosen_mask |= u_bit
+            r = r_red & ~u_bit
+    return best, chosen_mask
 
 
 def solve_vertex_cover_dp(n: int, edges: Iterable[Tuple[int, int]]) -> Tuple[int, Set[int]]:
@@ -31,89 +356,80 @@ def solve_vertex_cover_dp(n: int, edges: Iterable[Tuple[int, int]]) -> Tuple[int
 
     Recurrence:
       If there is no edge inside R_mask -> cost 0, choose empty set.
-      Otherwise pick any uncovered edge (u,v) inside R_mask.
-      In any vertex cover, at least one of u or v must be chosen,
-      i.e., removed from R_mask:
-        solve(R) = 1 + min( solve(R \\ {u}), solve(R \\ {v}) )
+      Otherwise pick the vertex u with the most neighbors N(u) inside R_mask.
+      Every vertex cover either contains u, or (if u is left out) must contain
+      all of N(u) to cover the edges at u:
+        solve(R) = min( 1 + solve(R \\ {u}), |N(u)| + solve(R \\ N[u]) )
+      I'm branching on a maximum-degree vertex instead of an arbitrary edge
+      because the second branch then removes |N(u)| + 1 vertices at once, which
+      shrinks the search tree far more than the 2-way edge branch (1 vertex each).
+      Before branching, degree-0 and degree-1 vertices are reduced away
+      (see `reduce_and_pick`), and states whose matching lower bound can't
+      beat the best cost known to the caller are pruned (branch-and-bound).
 
     Returns:
       (min_size, chosen_set)
     """
+    return _solve(n, edges, _solve_component)
+
+
+def _solve(
+    n: int,
+    edges: Iterable[Tuple[int, int]],
+    solve_component: Callable[[List[int]], Tuple[int, int]],
+) -> Tuple[int, Set[int]]:
+    """
+    Self-loops, component split and relabeling around `solve_component`.
+    I'm keeping this separate so `vertex_cover_numba` can plug in its kernel.
+    """
     # Build adjacency bitmasks
     adj: List[int] = [0] * n
+    # A self-loop u-u can only be covered by u itself, so those vertices are
+    # forced into the cover up front and the DP only sees simple edges.
+    forced_mask = 0
     for u, v in edges:
         if u == v:
-            # Self-loop must be covered by selecting u (or v), but u==v.
-            # We'll just set adjacency bit so it is detected as an "edge inside R".
-            adj[u] |= 1 << u
+            forced_mask |= 1 << u
             continue
         adj[u] |= 1 << v
         adj[v] |= 1 << u
 
-    full_mask = (1 << n) - 1
-
-    def find_any_edge_in_induced_subgraph(r_mask: int) -> Tuple[int, int] | None:
-        """Return (u,v) such that u-v is an uncovered edge inside r_mask, else None."""
-        # Scan vertices; if u has any neighbor within r_mask, we found an uncovered edge.
-        rm = r_mask
-        while rm:
-            lsb = rm & -rm
-            u = (lsb.bit_length() - 1)
-            rm ^= lsb
-            neigh_in_r = adj[u] & r_mask
-            # For self-loop u-u, neigh_in_r includes u bit. For normal edges, any neighbor bit.
-            if neigh_in_r:
-                v_bit = neigh_in_r & -neigh_in_r
-                v = v_bit.bit_length() - 1
-                if u == v and not (adj[u] & (1 << u)):
-                    continue
-                return u, v
-        return None
-
-    choice: dict[int, int] = {}  # r_mask -> chosen vertex at this state (remove from R)
+    full_mask = ((1 << n) - 1) & ~forced_mask
 
-    @lru_cache(maxsize=None)
-    def dp(r_mask: int) -> int:
-        edge = find_any_edge_in_induced_subgraph(r_mask)
-        if edge is None:
-            return 0
-        u, v = edge
-
-        # Branch: choose u or choose v (remove from remaining set)
-        r_without_u = r_mask & ~(1 << u)
-        r_without_v = r_mask & ~(1 << v)
-
-        cu = 1 + dp(r_without_u)
-        cv = 1 + dp(r_without_v)
-
-        # Deterministic tie-break: choose smaller vertex id
-        if cu < cv or (cu == cv and u <= v):
-            choice[r_mask] = u
-            return cu
-        else:
-            choice[r_mask] = v
-            return cv
-
-    best = dp(full_mask)
-
-    # Reconstruct chosen set by replaying decisions from full_mask
-    chosen: Set[int] = set()
-    r = full_mask
-    while True:
-        edge = find_any_edge_in_induced_subgraph(r)
-        if edge is None:
-            break
-        picked = choice[r]
-        chosen.add(picked)
-        r &= ~(1 << picked)
+    # A minimum cover of the graph is the union of minimum covers of its
+    # connected components, so I'm solving each component on its own: the
+    # states then range over subsets of one component instead of all of R.
+    best = _popcount(forced_mask)
+    chosen: Set[int] = set(_mask_bits(forced_mask))
+    for comp in _component_masks(adj, full_mask):
+        # I'm relabeling the component to 0..k-1 so its masks stay k bits wide:
+        # for k <= 63 they are single-digit ints, instead of n-bit ints whose
+        # every AND/negate walks all the digits of the whole graph.
+        # Labels go by ascending degree (ties by id): every lowest-bit-first
+        # scan then meets low-degree vertices first, so the greedy matching
+        # bound matches leaves before hubs and comes out larger, and the
+        # reductions reach pendant vertices sooner.
+        verts = sorted(_mask_bits(comp), key=lambda v: _popcount(adj[v] & comp))
+        local = {v: i for i, v in enumerate(verts)}
+        local_adj: List[int] = [0] * len(verts)
+        for i, v in enumerate(verts):
+            for w in _mask_bits(adj[v] & comp):
+                local_adj[i] |= 1 << local[w]
+        cost, local_chosen = solve_component(local_adj)
+        best += cost
+        chosen.update(verts[i] for i in _mask_bits(local_chosen))
 
     return best, chosen
 
 
 def is_vertex_cover(n: int, edges: Iterable[Tuple[int, int]], cover: Set[int]) -> bool:
     """Utility: verify cover correctness."""
+    # Pack the cover into one bitmask so each edge test is a shift-OR-AND.
+    cover_mask = 0
+    for v in cover:
+        cover_mask |= 1 << v
     for u, v in edges:
-        if u not in cover and v not in cover:
+        if not ((cover_mask >> u) | (cover_mask >> v)) & 1:
             return False
     return True
 
@@ -0,0 +1,243 @@
+"""
+Numba-compiled version of the per-component solver in `vertex_cover_dp.py`.
+
+The Python solver spends nearly all of its time interpreting a handful of
+integer/bitmask operations per state. For components of at most 63 vertices
+every mask fits in a uint64, so I'm running the same algorithm (degree-0/1
+reductions, max-degree branching, matching lower bound, memoized
+branch-and-bound) as one jitted function: `_solve_component_kernel`. It walks
+the recursion with an explicit frame stack, because Numba compiles loops much
+better than recursive calls.
+
+Preprocessing (self-loops, components, relabeling) is shared with
+`vertex_cover_dp`; components above 63 vertices use the Python solver.
+Numba is optional: without it, `solve_vertex_cover_dp` below is exactly the
+Python one.
+"""
+from __future__ import annotations
+
+from typing import Iterable, List, Set, Tuple
+
+import numpy as np
+
+import vertex_cover_dp
+
+try:
+    from numba import njit, types
+    from numba.typed import Dict
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAVE_NUMBA = False
+
+# Largest component the kernel accepts: full_mask = (1 << k) - 1 must fit in uint64
+MAX_KERNEL_VERTICES = 63
+
+
+def _popcount64(x: np.uint64) -> int:
+    """SWAR population count of a uint64."""
+    x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return int((x * np.uint64(0x0101010101010101)) >> np.uint64(56))
+
+
+def _solve_component_kernel(
+    adj: np.ndarray, r_top: np.uint64, ub_top: int, memo, lower, pick, nxt
+) -> Tuple[int, np.uint64]:
+    """
+    Same DP as `vertex_cover_dp._solve_component` on uint64 masks.
+
+    adj[i] is the neighbor mask of local vertex i (k = len(adj) <= 63). The
+    search starts at r_top with bound ub_top, which must exceed the minimum
+    cover of r_top (see `vertex_cover_dp._high_degree_kernel`). The four typed
+    dicts are the memo (exact costs), the lower bounds of pruned states, and
+    the decision of each exact state (vertices added, next mask).
+    Returns:
+      (min_size of r_top, chosen_mask)
+    """
+    k = adj.shape[0]
+    one = np.uint64(1)
+    zero = np.uint64(0)
+
+    # Frame stack: one frame per open dp() call. The depth is at most k + 1,
+    # since every branch removes at least one vertex.
+    depth = k + 2
+    f_r = np.zeros(depth, np.uint64)
+    f_ub = np.zeros(depth, np.int64)
+    f_known = np.zeros(depth, np.int64)
+    f_red = np.zeros(depth, np.uint64)
+    f_forced = np.zeros(depth, np.uint64)
+    f_cost = np.zeros(depth, np.int64)
+    f_ubit = np.zeros(depth, np.uint64)
+    f_nu = np.zeros(depth, np.uint64)
+    f_d = np.zeros(depth, np.int64)
+    f_cu = np.zeros(depth, np.int64)
+    f_phase = np.zeros(depth, np.int64)
+
+    sp = 1
+    f_r[0] = r_top
+    f_ub[0] = ub_top
+    f_phase[0] = 0
+    ret = 0
+
+    while sp > 0:
+        f = sp - 1
+        phase = f_phase[f]
+        if phase == 0:
+            r = f_r[f]
+            ub = f_ub[f]
+            if r in memo:
+                ret = memo[r]
+                sp -= 1
+                continue
+            known = lower[r] if r in lower else 0
+            if known >= ub:
+                ret = known
+                sp -= 1
+                continue
+
+            # Degree-0 / degree-1 reductions, then the max-degree vertex
+            red = r
+            forced = zero
+            cost = 0
+            while True:
+                changed = False
+                best_i = -1
+                best_nu = zero
+                best_d = 0
+                for i in range(k):
+                    bit = one << np.uint64(i)
+                    if not (red & bit):
+                        continue
+                    nu = adj[i] & red
+                    if nu == zero:
+                        red ^= bit
+                        continue
+                    if (nu & (nu - one)) == zero:
+                        forced |= nu
+                        cost += 1
+                        red &= ~(nu | bit)
+                        changed = True
+                        continue
+                    d = _popcount64(nu)
+                    if d > best_d:
+                        best_i = i
+                        best_nu = nu
+                        best_d = d
+                if not changed:
+                    break
+
+            if best_d == 0:
+                # The reductions covered every edge
+                memo[r] = cost
+                if forced != zero:
+                    pick[r] = forced
+                    nxt[r] = red
+                ret = cost
+                sp -= 1
+                continue
+
+            # Greedy maximal matching lower bound
+            rm = red
+            m = 0
+            for i in range(k):
+                bit = one << np.uint64(i)
+                if not (rm & bit):
+                    continue
+                rm ^= bit
+                nb = adj[i] & rm
+                if nb != zero:
+                    rm ^= nb & (~nb + one)
+                    m += 1
+            bound = cost + m
+            if bound >= ub:
+                val = bound if bound > known else known
+                lower[r] = val
+                ret = val
+                sp -= 1
+                continue
+
+            ubit = one << np.uint64(best_i)
+            f_known[f] = known
+            f_red[f] = red
+            f_forced[f] = forced
+            f_cost[f] = cost
+            f_ubit[f] = ubit
+            f_nu[f] = best_nu
+            f_d[f] = best_d
+            f_phase[f] = 1
+            # Branch 1: u goes into the cover
+            f_r[sp] = red & ~ubit
+            f_ub[sp] = ub - cost - 1
+            f_phase[sp] = 0
+            sp += 1
+        elif phase == 1:
+            cu = f_cost[f] + 1 + ret
+            f_cu[f] = cu
+            ub = f_ub[f]
+            ub_nu = cu if cu < ub else ub
+            f_phase[f] = 2
+            # Branch 2: u stays out, all of N(u) goes into the cover
+            f_r[sp] = f_red[f] & ~(f_nu[f] | f_ubit[f])
+            f_ub[sp] = ub_nu - f_cost[f] - f_d[f]
+            f_phase[sp] = 0
+            sp += 1
+        else:
+            r = f_r[f]
+            cu = f_cu[f]
+            cn = f_cost[f] + f_d[f] + ret
+            best_here = cu if cu <= cn else cn
+            if best_here >= f_ub[f]:
+                known = f_known[f]
+                val = best_here if best_here > known else known
+                lower[r] = val
+                ret = val
+            else:
+                if cu <= cn:
+                    pick[r] = f_forced[f] | f_ubit[f]
+                    nxt[r] = f_red[f] & ~f_ubit[f]
+                else:
+                    pick[r] = f_forced[f] | f_nu[f]
+                    nxt[r] = f_red[f] & ~(f_nu[f] | f_ubit[f])
+                memo[r] = best_here
+                ret = best_here
+            sp -= 1
+
+    # Replay the decisions from r_top
+    chosen = zero
+    r = r_top
+    while r in pick:
+        chosen |= pick[r]
+        r = nxt[r]
+    return ret, chosen
+
+
+if HAVE_NUMBA:
+    _popcount64 = njit(cache=True)(_popcount64)
+    _solve_component_kernel = njit(cache=True)(_solve_component_kernel)
+
+
+def _solve_component(adj: List[int]) -> Tuple[int, int]:
+    """
+    Drop-in replacement for `vertex_cover_dp._solve_component` that runs the
+    compiled kernel when the component fits in a uint64 mask.
+    """
+    if not HAVE_NUMBA or len(adj) > MAX_KERNEL_VERTICES:
+        return vertex_cover_dp._solve_component(adj)
+    memo = Dict.empty(key_type=types.uint64, value_type=types.int64)
+    lower = Dict.empty(key_type=types.uint64, value_type=types.int64)
+    pick = Dict.empty(key_type=types.uint64, value_type=types.uint64)
+    nxt = Dict.empty(key_type=types.uint64, value_type=types.uint64)
+    r_top, top_forced, budget = vertex_cover_dp._high_degree_kernel(adj)
+    best, chosen = _solve_component_kernel(
+        np.array(adj, dtype=np.uint64), np.uint64(r_top), budget + 1, memo, lower, pick, nxt
+    )
+    return vertex_cover_dp._popcount(top_forced) + int(best), top_forced | int(chosen)
+
+
+def solve_vertex_cover_dp(n: int, edges: Iterable[Tuple[int, int]]) -> Tuple[int, Set[int]]:
+    """
+    Same result as `vertex_cover_dp.solve_vertex_cover_dp`, with components of
+    up to 63 vertices solved by the compiled kernel when Numba is available.
+    """
+    return vertex_cover_dp._solve(n, edges, _solve_component)